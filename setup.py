@@ -14,9 +14,11 @@ setup(
     install_requires=[
         "questionary>=1.10.0",
         "rich>=10.0.0",
-        "pathlib>=1.0.1"
+        "rapidfuzz>=3.0.0"
     ],
     extras_require={
+        # Optional DFA engine for content regexes; no wheels for ARM, so not a default requirement
+        "hyperscan": ["hyperscan>=0.4.0; platform_system != 'Windows'"],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
@@ -2,6 +2,12 @@
 Findr - Interactive File Search Tool
 """
 
-from .cli import main
-
 __all__ = ['main']
+
+
+def __getattr__(name):
+    # Resolve main on first access so "import findr" does not load the CLI stack
+    if name == "main":
+        from .cli import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,15 +2,20 @@
 Command-line interface implementation.
 """
 import sys
-import argparse
-from pathlib import Path
-from rich.console import Console
-from .core import SearchTool
-from .ui import UI
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from .config import Config
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 def parse_args():
-    """Parse command line arguments"""
+    """Parse command line arguments (argparse is only imported when there are any)"""
+    if len(sys.argv) <= 1:
+        return SimpleNamespace(skip_intro=False, preset=None, list_presets=False,
+                               directory=None, save_preset=None)
+
+    import argparse
     parser = argparse.ArgumentParser(description="Findr - Interactive File Search Tool")
     parser.add_argument("-s", "--skip-intro", action="store_true", 
                        help="Skip the intro/help prompt")
@@ -24,7 +29,7 @@ def parse_args():
                        help="Save current search parameters as a new preset")
     return parser.parse_args()
 
-def list_presets(config: Config, console: Console):
+def list_presets(config: Config, console: "Console"):
     """Display available presets"""
     from rich.table import Table
     
@@ -51,11 +56,12 @@ def load_preset(config: Config, preset_name: str) -> dict:
         raise ValueError(f"Preset '{preset_name}' not found")
         
     preset = presets[preset_name]
+    # Lists are copied so editing the params never mutates the preset in the config
     return {
         "path": ".",  # Will be overridden by user input or command line
         "pattern": "*",  # Default pattern
-        "extensions": preset.get("extensions", []),
-        "exclude": preset.get("exclude_dirs", []),
+        "extensions": list(preset.get("extensions", ())),
+        "exclude": list(preset.get("exclude_dirs", ())),
         "min_size": preset.get("min_size"),
         "max_size": preset.get("max_size"),
         "content_pattern": "|".join(preset["content_patterns"]) if "content_patterns" in preset else None,
@@ -65,19 +71,24 @@ def load_preset(config: Config, preset_name: str) -> dict:
 
 def main():
     """Main entry point for the CLI"""
-    console = Console()
     args = parse_args()
-    
+
+    from rich.console import Console
+    console = Console()
+
     try:
         config = Config()
-        ui = UI()
-        tool = SearchTool()
-        
-        # Handle preset listing
+
+        # Handle preset listing before the search UI and engine are imported
         if args.list_presets:
             list_presets(config, console)
             return
-            
+
+        from .core import SearchTool
+        from .ui import UI
+        ui = UI()
+        tool = SearchTool()
+
         # Load preset if specified
         initial_params = {}
         if args.preset:
@@ -107,17 +118,17 @@ def main():
                 "max_size": params.get("max_size"),
                 "content_patterns": [params.get("content_pattern")] if params.get("content_pattern") else []
             }
-            presets = config.get("presets", {})
+            presets = dict(config.get("presets", {}))  # Copy so the defaults stay untouched
             presets[args.save_preset.lower()] = new_preset
             config.set("presets", presets)
             config.save_user_config()
             console.print(f"[green]✓ Saved preset:[/green] {args.save_preset}")
         
-        # Execute search
-        with console.status("[bold cyan]Searching...[/bold cyan]", spinner="dots"):
-            tool.search(params)
-        
-        ui.display_results(tool.results)
+        config.save_search_history(params)
+
+        # Execute search, streaming rows into the results table as they are found,
+        # then redraw the finished table sorted by sort_by/sort_reverse, previewing its first files
+        ui.display_results(tool.iter_rows(params), sort=lambda rows: tool.sort_rows(params))
         
     except KeyboardInterrupt:
         console.print("\n[yellow]Search cancelled by user[/yellow]")
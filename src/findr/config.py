@@ -1,12 +1,21 @@
 """
 Configuration management for the Findr tool.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+from collections import ChainMap
+from types import MappingProxyType
+import functools
 import json
 from pathlib import Path
 import os
+import time
 
-DEFAULT_CONFIG = {
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib parser
+    orjson = None
+
+DEFAULT_CONFIG = MappingProxyType({
     # Search settings
     "fuzzy_threshold": 80,  # Minimum score for fuzzy matching (0-100)
     "max_results": 100,     # Maximum number of results to display
@@ -85,6 +94,7 @@ DEFAULT_CONFIG = {
     "sort_reverse": False,
     "show_preview": True,
     "preview_length": 200,    # Characters to show in preview
+    "syntax_theme": "monokai",  # Pygments style for previews
     "theme": {
         "path": "blue",
         "size": "green",
@@ -100,6 +110,7 @@ DEFAULT_CONFIG = {
     "use_cache": True,
     "parallel_search": True,
     "max_workers": None,      # None = use CPU count
+    "dir_filter_cache": 0,    # Directory name filters kept between searches in one process (0 = off)
     
     # Content search settings
     "context_lines": 2,       # Lines of context around matches
@@ -111,11 +122,52 @@ DEFAULT_CONFIG = {
     "save_history": True,
     "history_file": "~/.findr_history",
     "max_history": 1000
-}
+})
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str, separators=(',', ':')).encode('utf-8')
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _brace_expand(text: str) -> List[str]:
+    """Expand every '{a,b}' group in text into the cross product of its alternatives, in one pass"""
+    expanded = ['']
+    i = 0
+    while i < len(text):
+        end = text.find('}', i) if text[i] == '{' else -1
+        if end != -1:
+            alternatives = text[i + 1:end].split(',')
+            expanded = [head + alt.strip() for head in expanded for alt in alternatives]
+            i = end + 1
+        else:
+            expanded = [head + text[i] for head in expanded]
+            i += 1
+    return expanded
+
+def _expand_braces(pattern: str) -> Tuple[str, ...]:
+    """Expand an extension glob such as '*.{js,jsx}' into suffixes ('.js', '.jsx')"""
+    body = pattern.strip().lstrip('*.')
+    if not body:
+        return ()
+    return tuple('.' + suffix for suffix in _brace_expand(body))
+
+@functools.lru_cache(maxsize=4)
+def _load_user_config(path: str, mtime_ns: int) -> dict:
+    """Parse a user config file; cached until the file's mtime changes"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
 
 class Config:
     def __init__(self):
-        self._config = DEFAULT_CONFIG.copy()
+        # Writes land in the front map; reads fall through to the read-only defaults
+        self._config = ChainMap({}, DEFAULT_CONFIG)
         self.load_user_config()
         
     def load_user_config(self):
@@ -123,26 +175,82 @@ class Config:
         config_dir = Path.home() / ".findr"
         config_file = config_dir / "config.json"
         
-        if config_file.exists():
-            try:
-                with open(config_file, 'r') as f:
-                    user_config = json.load(f)
-                self._config.update(user_config)
-            except json.JSONDecodeError:
-                print("Warning: Invalid user config file")
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except OSError:
+            return
+
+        try:
+            self._config.update(_load_user_config(str(config_file), mtime_ns))
+        except json.JSONDecodeError:
+            print("Warning: Invalid user config file")
                 
     def save_user_config(self):
-        """Save current configuration to user config file"""
+        """Save the user's overrides (not the defaults) to the user config file"""
         config_dir = Path.home() / ".findr"
         config_file = config_dir / "config.json"
         
         try:
             config_dir.mkdir(parents=True, exist_ok=True)
-            with open(config_file, 'w') as f:
-                json.dump(self._config, f, indent=4)
+            if orjson is not None:
+                config_file.write_bytes(orjson.dumps(self._config.maps[0], option=orjson.OPT_INDENT_2))
+            else:
+                with open(config_file, 'w') as f:
+                    json.dump(self._config.maps[0], f, indent=4)
         except OSError as e:
             print(f"Error saving config: {e}")
             
+    def _history_path(self) -> Path:
+        return Path(os.path.expanduser(self.get("history_file", "~/.findr_history")))
+
+    def save_search_history(self, params: dict):
+        """Append a search to the history file (one JSON object per line)"""
+        if not self.get("save_history", True):
+            return
+        history_file = self._history_path()
+        max_history = self.get("max_history", 1000)
+        try:
+            with open(history_file, 'ab') as f:
+                f.write(_dumps({"ts": time.time(), **params}) + b'\n')
+                size = f.tell()
+            # Compact only once the log is well past max_history average-sized rows
+            if size > max_history * 512:
+                self._compact_history(history_file, max_history)
+        except OSError as e:
+            print(f"Error saving history: {e}")
+
+    def _compact_history(self, history_file: Path, keep: int):
+        """Rewrite the history file with only its last keep entries"""
+        with open(history_file, 'rb') as f:
+            lines = f.read().splitlines(keepends=True)[-keep:]
+        tmp_file = history_file.with_name(history_file.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            f.writelines(lines)
+        os.replace(tmp_file, history_file)
+
+    def load_recent_searches(self, n: int = 10) -> list:
+        """Return the last n searches from the history file, oldest first"""
+        try:
+            with open(self._history_path(), 'rb') as f:
+                # Read backwards in blocks until n complete lines are in hand
+                pos = f.seek(0, os.SEEK_END)
+                data = b''
+                while pos > 0 and data.count(b'\n') <= n:
+                    step = min(8192, pos)
+                    pos -= step
+                    f.seek(pos)
+                    data = f.read(step) + data
+        except OSError:
+            return []
+
+        searches = []
+        for line in data.splitlines()[-n:]:
+            try:
+                searches.append(_loads(line))
+            except ValueError:
+                continue
+        return searches
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
         return self._config.get(key, default)
@@ -157,10 +265,10 @@ class Config:
         
     def reset(self):
         """Reset configuration to defaults"""
-        self._config = DEFAULT_CONFIG.copy()
+        self._config = ChainMap({}, DEFAULT_CONFIG)
 
     @property
-    def config(self) -> dict:
+    def config(self) -> ChainMap:
         """Get the entire configuration dictionary"""
         return self._config
 
@@ -1,94 +1,344 @@
 """
 Core search functionality implementation.
 """
-from typing import List, Optional
-from pathlib import Path
-from datetime import datetime
+from typing import Iterator, List, Optional, Pattern, Union
+from dataclasses import dataclass
 import os
 import fnmatch
+import functools
+import mmap
 import platform
+import queue
 import re
+import sys
+import threading
+import time
 import json
-from itertools import islice
+from array import array
+from stat import S_ISREG
+from contextlib import closing
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.syntax import Syntax
-from thefuzz import fuzz
-from .optimizations import SearchOptimizer
-from .config import Config
+from rapidfuzz import fuzz
+from .optimizations import SearchOptimizer, TrigramBloom, _split_excludes, match_batch, scan_tree, trigrams
+from .config import Config, _brace_expand, _expand_braces
+
+try:
+    import hyperscan
+except ImportError:  # Optional DFA regex engine, fall back to re
+    hyperscan = None
+
+# A single search hit as produced by the walker threads
+FileHit = namedtuple("FileHit", "path size mtime_ns type")
+
+# On POSIX the walker works on bytes paths, skipping a decode per scanned entry
+_BYTES_MODE = os.name == 'posix'
+
+# Result count above which numeric sorts are handed to NumPy, if it is installed
+_NUMPY_SORT_MIN = 10000
+
+# Size parsing/formatting tables
+_UNITS = {'': 1, 'B': 1, 'K': 1024, 'M': 1024**2, 'G': 1024**3, 'T': 1024**4}
+_SIZE_RE = re.compile(r'^\s*([\d.]+)\s*([KMGT]?)B?\s*$', re.IGNORECASE)
+
+# Characters that give a content pattern regex meaning; anything else is a plain literal
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+# Bytes lowercased per step of a case-insensitive literal scan
+_FOLD_CHUNK = 1 << 18
+
+# Leading bytes sniffed for a NUL, the git/grep test for binary content
+_SNIFF_SIZE = 8192
+
+# Entries whose names process_batch matches against the pattern in one call
+_MATCH_BATCH = 4096
 
 def process_batch(batch, pattern, search_path, params, config, format_size):
-    """Process a batch of directory entries."""
+    """Process a batch of directory trees, scanning each one with os.scandir."""
     results = []
-    for root, dirs, files in batch:
-        # Early pruning of excluded directories
-        dirs[:] = [d for d in dirs if not any(
-            excl in str(Path(root) / d)
-            for excl in config.get("default_excludes", [])
-        )]
-        
-        if params.get("dirs_only"):
-            for dir_name in dirs:
-                if pattern.lower() in dir_name.lower():
-                    dir_path = Path(root) / dir_name
-                    try:
-                        relative_path = dir_path.relative_to(search_path)
-                        stat = dir_path.stat()
-                        results.append({
-                            "path": str(relative_path),
-                            "size": "DIR",
-                            "modified": datetime.fromtimestamp(stat.st_mtime).strftime(
-                                config.get("date_format", "%Y-%m-%d %H:%M")
-                            ),
-                            "type": "directory"
-                        })
-                    except (ValueError, OSError):
-                        continue
-        else:
-            for file in files:
-                # Quick pattern check before more expensive operations
-                if pattern == "*" or pattern.lower() in file.lower():
-                    file_path = Path(root) / file
-                    try:
-                        relative_path = file_path.relative_to(search_path)
-                        stat = file_path.stat()
-                        results.append({
-                            "path": str(relative_path),
-                            "size": format_size(stat.st_size),
-                            "modified": datetime.fromtimestamp(stat.st_mtime).strftime(
-                                config.get("date_format", "%Y-%m-%d %H:%M")
-                            ),
-                            "type": "file"
-                        })
-                    except (ValueError, OSError):
-                        continue
+    exclude_names, exclude_globs = _split_excludes(config.get("default_excludes", []))
+    exclude_re = _compile_globs(exclude_globs)
+
+    # Loop invariants resolved once instead of per entry
+    append = results.append
+    relpath = os.path.relpath
+    strftime = time.strftime
+    localtime = time.localtime
+    date_format = config.get("date_format", "%Y-%m-%d %H:%M")
+    dirs_only = bool(params.get("dirs_only"))
+    needle = None if pattern == "*" else pattern.lower()
+
+    def is_excluded(entry):
+        return entry.name in exclude_names or (exclude_re is not None and exclude_re.match(entry.name) is not None)
+
+    def emit(entries):
+        # Names are matched a batch at a time, so only the hits reach this loop
+        if needle is not None:
+            entries = [entries[i] for i in match_batch([entry.name for entry in entries], needle)]
+        for entry in entries:
+            try:
+                relative_path = relpath(entry.path, search_path)
+                stat = entry.stat(follow_symlinks=False)
+            except (ValueError, OSError):
+                continue
+            append({
+                "path": relative_path,
+                "size": "DIR" if dirs_only else format_size(stat.st_size),
+                "modified": strftime(date_format, localtime(stat.st_mtime)),
+                "type": "directory" if dirs_only else "file"
+            })
+
+    for top in batch:
+        pending = []
+        # Early pruning of excluded directories, before they are descended into
+        for entry in scan_tree(top, is_excluded):
+            try:
+                # Quick type check before more expensive operations
+                if entry.is_dir(follow_symlinks=False) != dirs_only:
+                    continue
+            except OSError:
+                continue
+            pending.append(entry)
+            if len(pending) >= _MATCH_BATCH:
+                emit(pending)
+                pending = []
+        emit(pending)
     return results
 
+@dataclass
+class CompiledQuery:
+    """Search parameters normalized once per search so the walk loop does no parsing.
+
+    In bytes mode root, the name matchers, the extensions and the excludes are bytes,
+    matching what os.scandir returns for a bytes root.
+    """
+    bytes_mode: bool
+    root: Union[str, bytes]
+    name_needle: Optional[Union[str, bytes]]
+    name_re: Optional[Pattern]
+    pattern_norm: Optional[str]
+    ext_tuple: tuple
+    ext_set: Optional[frozenset]
+    exclude_set: frozenset
+    exclude_globs: tuple
+    exclude_re: Optional[Pattern]
+    content_re: Optional[Pattern]
+    content_fuzzy: Optional[str]
+    literal: Optional[bytes]
+    literal_fold: bool
+    content_db: Optional["hyperscan.Database"]
+    content_size_limit: Optional[int]
+    min_size: int
+    max_size: Optional[int]
+    dirs_only: bool
+    max_depth: Optional[int]
+    follow_symlinks: bool
+    fuzzy_threshold: float
+
+    @property
+    def mapped(self) -> bool:
+        """True when the content filter runs directly on the memory-mapped file bytes"""
+        return self.literal is not None or \
+            (self.content_re is not None and isinstance(self.content_re.pattern, bytes))
+
+def _compile_globs(patterns) -> Optional[Pattern]:
+    """Compile glob patterns (all str or all bytes) into one regex, or None if there are none"""
+    if not patterns:
+        return None
+    # Match fnmatch.fnmatch, which normalizes case on case-insensitive platforms
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    if isinstance(patterns[0], bytes):
+        # fnmatch's own bytes support: translate the Latin-1 decoding, then re-encode
+        return re.compile(b'|'.join(
+            b'(?:' + fnmatch.translate(p.decode('latin-1')).encode('latin-1') + b')' for p in patterns), flags)
+    return re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in patterns), flags)
+
+def _find_folded(data, needle: bytes) -> int:
+    """Offset of needle (already lowercase) in data ignoring ASCII case, or -1.
+
+    Lowercasing a chunk and calling find is C all the way and several times
+    faster than an IGNORECASE regex; chunks overlap so no match is split.
+    """
+    overlap = len(needle) - 1
+    for pos in range(0, len(data), _FOLD_CHUNK):
+        found = data[pos:pos + _FOLD_CHUNK + overlap].lower().find(needle)
+        if found != -1:
+            return pos + found
+    return -1
+
+def _stop_scan(*_) -> bool:
+    """Hyperscan match handler that ends the scan at the first match"""
+    return True
+
+class _DirStack:
+    """Directories still to be scanned, shared by every walker thread.
+
+    Subdirectories go back on the shared stack instead of a per-thread one, so
+    an idle walker picks up the backlog of a busy one rather than exiting while
+    a single deep subtree is still being walked. When symlinks are followed,
+    seen holds the (st_dev, st_ino) of every directory pushed so far, so a
+    link back up the tree can't send the walkers round in a loop.
+    """
+    __slots__ = ("_items", "_active", "_lock", "_stopped", "_seen")
+
+    def __init__(self, items: list, stopped, seen: Optional[set] = None):
+        self._items = items
+        self._active = 0
+        self._lock = threading.Lock()
+        self._stopped = stopped
+        self._seen = seen if seen is not None else set()
+
+    def push(self, item: tuple):
+        # Only called by a walker that is still active, so pop() can't miss it
+        self._items.append(item)
+
+    def pop(self) -> Optional[tuple]:
+        """Next (path, depth) to scan, or None once the stack is empty and no walker can refill it"""
+        while True:
+            with self._lock:
+                if self._items:
+                    self._active += 1
+                    return self._items.pop()
+                if self._active == 0:
+                    return None
+            if self._stopped():
+                return None
+            time.sleep(0.001)
+
+    def done(self):
+        """Mark the directory handed out by the last pop() as finished"""
+        with self._lock:
+            self._active -= 1
+
+    def visit(self, key: tuple) -> bool:
+        """Record a directory's (st_dev, st_ino); False when it was already seen"""
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            return True
+
 class SearchTool:
+    DEFAULT_EXCLUDES = frozenset({'node_modules', '.build', 'dist', '.next', '__pycache__', '.git'})
+    # Formats never worth opening for a content search
+    BINARY_EXTS = frozenset({
+        '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp', '.tiff', '.psd',
+        '.mp3', '.mp4', '.m4a', '.wav', '.flac', '.ogg', '.avi', '.mov', '.mkv', '.webm',
+        '.zip', '.tar', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.jar', '.whl',
+        '.so', '.dll', '.dylib', '.exe', '.o', '.a', '.class', '.pyc', '.wasm',
+        '.pdf', '.sqlite', '.db', '.iso', '.dmg', '.woff', '.woff2', '.ttf', '.otf',
+    })
+
     def __init__(self):
-        self.DEFAULT_EXCLUDES = ['node_modules', '.build', 'dist', '.next', '__pycache__', '.git']
-        self.results = []
+        # Results are kept column-wise (struct of arrays); see the results property
+        self.paths: List[str] = []
+        self.sizes = array('q')
+        self.mtimes = array('q')  # st_mtime_ns, so sorts compare machine ints
+        self.types: List[str] = []
+        self.previews: dict = {}
+        self.results_queue = queue.Queue()
+        self.should_stop = False
+        self.search_stopped = False
+        # Set by the stdin watcher thread when Enter is pressed during a search
+        self._enter_pressed = threading.Event()
+        self._stdin_watcher: Optional[threading.Thread] = None
+        # Last complete search, reused when the next query only narrows it
+        self._last_query: Optional[CompiledQuery] = None
+        self._last_hits: Optional[List[FileHit]] = None
+        # Per-directory trigram filters of entry names, keyed by (path, mtime) and LRU-evicted;
+        # only built when dir_filter_cache is set, for processes that run several searches
+        self._dir_bloom: "OrderedDict[tuple, TrigramBloom]" = OrderedDict()
+        self._dir_bloom_lock = threading.Lock()
         self.console = Console()
         self.is_windows = platform.system() == "Windows"
         self.config = Config()
+        # Configured excludes, split once: names are pruned by hash lookup, globs by fnmatch
+        self._exclude_names, self._exclude_globs = _split_excludes(
+            self.config.get("default_excludes", self.DEFAULT_EXCLUDES))
+        self._exclude_re = _compile_globs(self._exclude_globs)
+        # Both forms, since the walker produces bytes paths on POSIX
+        self._binary_exts = self.BINARY_EXTS | frozenset(map(os.fsencode, self.BINARY_EXTS))
         self.optimizer = SearchOptimizer(self.config.config)
+        # Fuzzy scores are memoized per (pattern, name); cleared at the start of each search
+        self._score = functools.lru_cache(maxsize=4096)(self._raw_score)
+        # Hyperscan scratch space can't be shared between concurrent scans
+        self._hs_local = threading.local()
+
+    @staticmethod
+    def _raw_score(pattern_norm: str, name_norm: str, score_cutoff: float = 0) -> float:
+        """Fuzzy similarity of two already-normalized strings (0 when below score_cutoff)"""
+        return fuzz.partial_ratio(pattern_norm, name_norm, score_cutoff=score_cutoff)
         
-    def parse_size(self, size_str: str) -> int:
-        """Convert human-readable size to bytes"""
-        if not size_str:
+    @property
+    def results(self) -> List[dict]:
+        """Search results as display rows, formatted from the result columns"""
+        rows = []
+        for i, hit in enumerate(zip(self.paths, self.sizes, self.mtimes, self.types)):
+            row = self.format_hit(FileHit(*hit))
+            if i in self.previews:
+                row["preview_fn"] = self.previews[i]
+            rows.append(row)
+        return rows
+
+    def format_hit(self, hit: FileHit) -> dict:
+        """Turn a hit into a display row with human-readable size and date"""
+        return {
+            "path": hit.path,
+            "size": "DIR" if hit.type == "directory" else self.format_size(hit.size),
+            "modified": time.strftime(self.config.get("date_format", "%Y-%m-%d %H:%M"), time.localtime(hit.mtime_ns // 1_000_000_000)),
+            "type": hit.type
+        }
+
+    def _store_hits(self, hits: List[FileHit]):
+        """Transpose collected hits into the result columns"""
+        self.paths = [hit.path for hit in hits]
+        self.sizes = array('q', (hit.size for hit in hits))
+        self.mtimes = array('q', (hit.mtime_ns for hit in hits))
+        self.types = [hit.type for hit in hits]
+        self.previews = {}
+
+    def _sort(self, key: str, reverse: bool = False):
+        """Sort the result columns by permuting them with a single index order"""
+        columns = {"path": self.paths, "size": self.sizes, "modified": self.mtimes, "mtime": self.mtimes}
+        column = columns.get(key, self.paths)
+        order = None
+        if isinstance(column, array) and len(column) >= _NUMPY_SORT_MIN:
+            order = self._numpy_order(column, reverse)
+        if order is None:
+            order = sorted(range(len(column)), key=column.__getitem__, reverse=reverse)
+        self.paths = [self.paths[i] for i in order]
+        self.sizes = array('q', (self.sizes[i] for i in order))
+        self.mtimes = array('q', (self.mtimes[i] for i in order))
+        self.types = [self.types[i] for i in order]
+
+    @staticmethod
+    def _numpy_order(column: array, reverse: bool):
+        """Stable argsort of a numeric column with NumPy, or None when it is unavailable"""
+        try:
+            import numpy as np  # Imported lazily: only worth its import cost on big result sets
+        except ImportError:
+            return None
+        values = np.frombuffer(column, dtype=np.int64)
+        # Negate rather than reverse so ties keep their original order, as sorted() does
+        return np.argsort(-values if reverse else values, kind='stable').tolist()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def parse_size(size_str: str) -> int:
+        """Convert human-readable size to bytes (memoized; presets reuse a handful of strings)"""
+        if not size_str or size_str.isspace():
             return 0
-        units = {'K': 1024, 'M': 1024**2, 'G': 1024**3}
-        size_str = size_str.upper()
-        if size_str[-1] in units:
-            return int(float(size_str[:-1]) * units[size_str[-1]])
-        return int(size_str)
+        match = _SIZE_RE.match(size_str)
+        if not match:
+            raise ValueError(f"Invalid size: {size_str}")
+        return int(float(match[1]) * _UNITS[match[2].upper()])
 
     def format_size(self, size: int) -> str:
         """Convert bytes to human-readable size"""
-        for unit in ['B', 'K', 'M', 'G']:
-            if size < 1024:
-                return f"{size:.1f}{unit}"
-            size /= 1024
-        return f"{size:.1f}T"
+        i = min(max((int(size).bit_length() - 1) // 10, 0), 4)
+        return f"{size / (1 << (10 * i)):.1f}{'BKMGT'[i]}"
 
     def fuzzy_match(self, text: str, pattern: str) -> bool:
         """Perform fuzzy matching on text"""
@@ -98,270 +348,699 @@ class SearchTool:
             
         # If that fails, try fuzzy matching
         if pattern.startswith("~"):  # Explicit fuzzy search with ~ prefix
-            pattern = pattern[1:]
-            ratio = fuzz.partial_ratio(pattern.lower(), text.lower())
-            return ratio >= self.config.get("fuzzy_threshold", 65)
+            threshold = self.config.get("fuzzy_threshold", 65)
+            return self._score(pattern[1:].strip().lower(), text.lower(), threshold) >= threshold
             
         return False
 
-    def search_content(self, file_path: Path, pattern: str) -> bool:
-        """Search file content for pattern"""
+    def search_content(self, file_path: Union[str, bytes], query: CompiledQuery) -> bool:
+        """Search file content for the query's content pattern, skipping binary files"""
+        if os.path.splitext(file_path)[1].lower() in self._binary_exts:
+            return False
+        if query.mapped:
+            return self._search_mapped(file_path, query)
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                if pattern.startswith("~"):  # Fuzzy search in content
-                    pattern = pattern[1:]
-                    return fuzz.partial_ratio(pattern.lower(), content.lower()) >= self.config.get("fuzzy_threshold", 65)
-                return bool(re.search(pattern, content, re.IGNORECASE))
+                content = f.read(_SNIFF_SIZE)
+                if '\0' in content:
+                    return False
+                content += f.read()
+                if query.content_fuzzy is not None:  # Fuzzy search in content
+                    threshold = self.config.get("fuzzy_threshold", 65)
+                    return fuzz.partial_ratio(query.content_fuzzy, content.lower(), score_cutoff=threshold) >= threshold
+                return bool(query.content_re.search(content))
         except:
             return False
 
-    def preview_file(self, file_path: Path) -> str:
-        """Generate a preview of the file"""
+    def _search_mapped(self, file_path: Union[str, bytes], query: CompiledQuery) -> bool:
+        """Scan the raw file bytes for a literal or bytes regex without decoding them"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(self.config.get("preview_length", 1000))
-                syntax = Syntax(
-                    content, 
-                    file_path.suffix[1:] if file_path.suffix else "txt",
-                    theme=self.config.get("theme", "monokai")
-                )
-                return syntax
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b'\0', 0, _SNIFF_SIZE) != -1:
+                        return False
+                    if hasattr(mm, "madvise"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    if query.content_db is not None:
+                        try:
+                            # python-hyperscan only scans bytes, not an mmap or memoryview
+                            return self._hyperscan_matches(query.content_db, mm[:])
+                        except (TypeError, hyperscan.error):
+                            pass  # fall back to the bytes regex below
+                    return self._find_match(mm, query) != -1
+        except (OSError, ValueError):
+            return False
+
+    @staticmethod
+    def _compile_hyperscan(pattern: bytes, ignore_case: bool) -> Optional["hyperscan.Database"]:
+        """Compile a bytes regex for Hyperscan, or None when it is unavailable or can't take the pattern"""
+        if hyperscan is None:
+            return None
+        flags = hyperscan.HS_FLAG_SINGLEMATCH
+        if ignore_case:
+            flags |= hyperscan.HS_FLAG_CASELESS
+        db = hyperscan.Database()
+        try:
+            db.compile(expressions=[pattern], ids=[0], elements=1, flags=[flags])
+        except hyperscan.error:  # e.g. back-references or lookarounds
+            return None
+        return db
+
+    def _hyperscan_matches(self, db: "hyperscan.Database", data) -> bool:
+        """Scan data with db, stopping at the first match; scratch space is per thread"""
+        local = self._hs_local
+        if getattr(local, "db", None) is not db:
+            local.db = db
+            local.scratch = hyperscan.Scratch(db)
+        try:
+            db.scan(data, match_event_handler=_stop_scan, scratch=local.scratch)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+    @staticmethod
+    def _find_match(mm: mmap.mmap, query: CompiledQuery) -> int:
+        """Offset of the first content match in the mapping, or -1"""
+        if query.literal is not None:
+            if query.literal_fold:
+                return _find_folded(mm, query.literal)
+            return mm.find(query.literal)
+        match = query.content_re.search(mm)
+        return match.start() if match else -1
+
+    def _preview_match(self, file_path: str, query: CompiledQuery) -> Optional[str]:
+        """Decode only the lines around the first content match"""
+        context = self.config.get("context_lines", 2)
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hit = self._find_match(mm, query)
+                if hit == -1:
+                    return None
+                start = hit
+                for _ in range(context + 1):
+                    start = mm.rfind(b'\n', 0, start)
+                    if start == -1:
+                        break
+                start += 1
+                end = hit
+                for _ in range(context + 1):
+                    end = mm.find(b'\n', end + 1)
+                    if end == -1:
+                        end = len(mm)
+                        break
+                return mm[start:end].decode('utf-8', 'replace').rstrip('\n')
+
+    def preview_file(self, file_path: str, query: Optional[CompiledQuery] = None) -> str:
+        """Generate a preview of the file, centred on the content match when there is one"""
+        try:
+            content = None
+            if query is not None and query.mapped:
+                content = self._preview_match(file_path, query)
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    content = f.read(self.config.get("preview_length", 1000))
+            syntax = Syntax(
+                content[:self.config.get("preview_length", 1000)],
+                os.path.splitext(file_path)[1][1:] or "txt",
+                theme=self.config.get("syntax_theme", "monokai")
+            )
+            return syntax
         except:
             return "[red]Unable to preview file[/red]"
 
-    def should_include_file(self, file_path: Path, params: dict) -> bool:
-        """Check if file should be included based on filters"""
-        # For directory-only search
-        if params.get("dirs_only", False):
-            return file_path.is_dir()
+    def should_include_file(self, file_path: Union[str, bytes, os.DirEntry], query: CompiledQuery,
+                            stat_result: Optional[os.stat_result] = None) -> bool:
+        """Check if file should be included based on filters, cheapest checks first.
 
-        # Check if it's a file for normal searches
-        if not file_path.is_file():
-            return False
+        file_path is a path (bytes in bytes mode) or a DirEntry, whose cached
+        type and stat information is reused.
+        """
+        entry = file_path if isinstance(file_path, os.DirEntry) else None
+        path = entry.path if entry is not None else file_path
+
+        # For directory-only search
+        if query.dirs_only:
+            return entry.is_dir() if entry is not None else os.path.isdir(path)
 
-        # Check extensions
-        if params["extensions"] and not any(file_path.name.endswith(ext) for ext in params["extensions"]):
+        # String checks first: extension suffix, then exclude patterns
+        if query.ext_tuple:
+            name = (entry.name if entry is not None else os.path.basename(path)).lower()
+            if query.ext_set is not None:
+                # Single-dot extensions: one hash lookup on the last suffix
+                if name[name.rfind(b'.' if query.bytes_mode else '.'):] not in query.ext_set:
+                    return False
+            elif not name.endswith(query.ext_tuple):
+                return False
+        if query.exclude_re is not None and query.exclude_re.match(path):
             return False
 
-        # Check size
-        try:
-            size = os.path.getsize(file_path)
-            if params["min_size"] and size < self.parse_size(params["min_size"]):
+        # A single stat answers both "is it a regular file" and its size
+        if stat_result is None:
+            try:
+                if entry is not None:
+                    stat_result = entry.stat(follow_symlinks=query.follow_symlinks)
+                else:
+                    stat_result = os.stat(path)
+            except OSError:
                 return False
-            if params["max_size"] and size > self.parse_size(params["max_size"]):
+            if not S_ISREG(stat_result.st_mode):
                 return False
-        except OSError:
+        size = stat_result.st_size
+        if size < query.min_size:
+            return False
+        if query.max_size is not None and size > query.max_size:
             return False
 
-        # Check exclude patterns
-        exclude_patterns = params["exclude"] + self.config.get("default_excludes", self.DEFAULT_EXCLUDES)
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(str(file_path), pattern):
+        # Check content last (files above binary_size_limit are never read)
+        if query.content_re is not None or query.content_fuzzy is not None or query.literal is not None:
+            if query.content_size_limit is not None and size > query.content_size_limit:
                 return False
-
-        # Check content if specified
-        if params.get("content_pattern"):
-            if not self.search_content(file_path, params["content_pattern"]):
+            if not self.search_content(path, query):
                 return False
 
         return True
 
+    def _compile_params(self, params: dict) -> CompiledQuery:
+        """Precompute matchers for a search so they are built once, not per path"""
+        # A trailing '/' (as in '*/') only marks a directory search; names never contain it
+        pattern = params["pattern"].rstrip("/")
+        core = pattern.strip("*")
+        name_needle = None
+        name_source = None
+        pattern_norm = None
+        if core.startswith("~"):  # Explicit fuzzy name search with ~ prefix
+            pattern_norm = core[1:].strip().lower()
+        elif core and (any(c in core for c in "*?[{") or pattern.startswith("*") != pattern.endswith("*")):
+            # A real glob such as '*.py' or 'test_*.{js,ts}': match the whole name, braces expanded
+            name_source = r"\A(?:%s)" % "|".join(fnmatch.translate(glob) for glob in _brace_expand(pattern))
+        elif core:
+            # A plain substring, '*text*' or just 'text'
+            name_needle = core.lower()
+            name_source = re.escape(core)
+
+        # Per-search excludes extend the ones split at construction time
+        extra_names, extra_globs = _split_excludes(params["exclude"])
+        exclude_names = self._exclude_names | extra_names
+        exclude_globs = self._exclude_globs + extra_globs
+
+        content_re = None
+        content_fuzzy = None
+        literal = None
+        literal_fold = False
+        content_db = None
+        content_pattern = params.get("content_pattern")
+        if content_pattern:
+            ignore_case = params.get("ignore_case", self.config.get("ignore_case", True))
+            flags = re.IGNORECASE if ignore_case else 0
+            if content_pattern.startswith("~"):  # Explicit fuzzy search with ~ prefix
+                content_fuzzy = content_pattern[1:].lower()
+            elif _REGEX_META.isdisjoint(content_pattern) and (not ignore_case or content_pattern.isascii()):
+                # Plain literal: a byte-level find beats both regex and fuzzy scoring. Bytes only
+                # fold ASCII case, so caseless non-ASCII literals take the str regex path below
+                literal = content_pattern.encode('utf-8', 'ignore')
+                if ignore_case and literal.lower() != literal.upper():
+                    literal = literal.lower()
+                    literal_fold = True
+            else:
+                try:
+                    content_re = re.compile(content_pattern, flags)
+                except re.error:
+                    content_re = re.compile(re.escape(content_pattern), flags)
+                if content_pattern.isascii():
+                    # ASCII patterns can run on the mapped bytes, skipping the read and decode
+                    try:
+                        content_re = re.compile(content_re.pattern.encode('ascii'), flags)
+                    except re.error:
+                        pass
+                    else:
+                        content_db = self._compile_hyperscan(content_re.pattern, ignore_case)
+
+        # Bytes matching lowercases ASCII only, so fall back to str for other needles
+        extensions = [ext.lower() for pattern in params["extensions"] for ext in _expand_braces(pattern)]
+        bytes_mode = _BYTES_MODE and pattern_norm is None and \
+            all(text.isascii() for text in [pattern] + extensions)
+        native = os.fsencode if bytes_mode else str
+        ext_tuple = tuple(native(ext) for ext in extensions)
+        # Multi-dot extensions such as '.d.ts' span several suffixes and need endswith
+        single_dot = all('.' not in ext[1:] for ext in extensions)
+
+        return CompiledQuery(
+            bytes_mode=bytes_mode,
+            root=native(str(params["path"])),
+            name_needle=native(name_needle) if name_needle is not None else None,
+            name_re=re.compile(native(name_source), re.IGNORECASE) if name_source is not None else None,
+            pattern_norm=pattern_norm,
+            ext_tuple=ext_tuple,
+            ext_set=frozenset(ext_tuple) if single_dot else None,
+            exclude_set=frozenset(native(name) for name in exclude_names),
+            exclude_globs=tuple(native(glob) for glob in exclude_globs),
+            exclude_re=_compile_globs([native(glob) for glob in exclude_globs]),
+            content_re=content_re,
+            content_fuzzy=content_fuzzy,
+            literal=literal,
+            literal_fold=literal_fold,
+            content_db=content_db,
+            content_size_limit=self.config.get("binary_size_limit"),
+            min_size=self.parse_size(params["min_size"]) if params["min_size"] else 0,
+            max_size=self.parse_size(params["max_size"]) if params["max_size"] else None,
+            dirs_only=bool(params.get("dirs_only")),
+            max_depth=self.config.get("max_depth"),
+            follow_symlinks=self.config.get("follow_symlinks", False),
+            fuzzy_threshold=self.config.get("fuzzy_threshold", 65)
+        )
+
     def search(self, params: dict):
-        """Execute the search based on user parameters"""
-        import select
-        import sys
-        import tty
+        """Execute the search and store the sorted results"""
+        hits = []
+        for hit in self.iter_results(params):
+            hits.append(hit)
+            self.console.print(f"[green]Found:[/green] {hit.path}")
+        self._store_hits(hits)
+        self._finish_results(params)
+        self.console.print(f"\n[dim]Found {len(self.paths)} results[/dim]")
+
+    def _finish_results(self, params: dict):
+        """Sort the stored results and attach previews to the first few files"""
+        sort_key = params.get("sort_by", self.config.get("sort_by", "path"))
+        reverse = params.get("sort_reverse", self.config.get("sort_reverse", False))
+        self._sort(sort_key, reverse)
+
+        # Add previews if requested (only for the first few results to keep it fast);
+        # they are callables, so a preview is only read once its row is rendered
+        if params.get("preview", self.config.get("show_preview", True)):
+            for i in range(min(len(self.paths), 10)):  # Only preview first 10 results
+                if self.types[i] == "file":
+                    self.previews[i] = functools.partial(
+                        self.preview_file, os.path.join(params["path"], self.paths[i]), self._last_query)
+
+    def iter_rows(self, params: dict) -> Iterator[dict]:
+        """Stream display rows in walk order as hits arrive.
+
+        The hits are stored once the stream ends, so sort_rows can hand back
+        the sorted rows with their previews.
+        """
+        hits = []
+        for hit in self.iter_results(params):
+            hits.append(hit)
+            yield self.format_hit(hit)
+        self._store_hits(hits)
+
+    def sort_rows(self, params: dict) -> List[dict]:
+        """Rows streamed by iter_rows, sorted and previewed as search() leaves its results"""
+        self._finish_results(params)
+        return self.results
+
+    def iter_results(self, params: dict) -> Iterator[FileHit]:
+        """Yield search hits as soon as the walkers find them.
+
+        Stops after max_results hits or when Enter is pressed; closing the
+        generator early stops the walker threads as well.
+        """
+        self._enter_pressed.clear()
+        self._watch_stdin()
+        search_path = params["path"]
+        pattern = params["pattern"]
+        max_results = self.config.get("max_results", 1000)
+        
+        # Debug output
+        self.console.print(f"\n[dim]Searching in: {search_path}[/dim]")
+        self.console.print(f"[dim]Pattern: {pattern}[/dim]")
+        self.console.print("[dim]Press Enter to stop search and show results...[/dim]\n")
+        
+        # Initialize params with defaults
+        params.setdefault("extensions", [])
+        params.setdefault("min_size", None)
+        params.setdefault("max_size", None)
+        params.setdefault("exclude", [])
         
-        # Platform-specific imports
+        query = self._compile_params(params)
+        self._score.cache_clear()
+        self.search_stopped = False
+
+        if self._last_hits is not None and self._is_refinement(query, self._last_query):
+            # The new query only narrows the last one: filter its hits instead of walking again
+            source = self._refilter(self._last_hits, query)
+        else:
+            source = self._stream_hits(query, self._enter_pressed)
+        self._last_query = query
+        self._last_hits = None
+
+        hits = []
+        with closing(source):
+            for hit in source:
+                hits.append(hit)
+                yield hit
+                if len(hits) >= max_results:
+                    break
+
+        if self.search_stopped:
+            self.console.print("\n[yellow]Search stopped by user[/yellow]")
+        elif len(hits) >= max_results:
+            self.console.print("\n[yellow]Maximum results limit reached[/yellow]")
+        else:
+            # Only a complete result set can be refined later
+            self._last_hits = hits
+
+    def _watch_stdin(self):
+        """Start the Enter-key watcher thread once per tool, if stdin is a terminal"""
+        if self._stdin_watcher is not None or not sys.stdin.isatty():
+            return
+        self._stdin_watcher = threading.Thread(target=self._read_enter, daemon=True)
+        self._stdin_watcher.start()
+
+    def _read_enter(self):
+        """Block on stdin and flag every Enter press; the terminal stays in canonical mode"""
         if sys.platform == "win32":
             import msvcrt
+            while True:
+                if msvcrt.getwch() == '\r':
+                    self._enter_pressed.set()
         else:
-            import termios
-
-        def is_enter_pressed():
-            if sys.platform == "win32":
-                # Windows implementation
-                if msvcrt.kbhit():
-                    key = msvcrt.getch()
-                    return key == b'\r'
-                return False
-            else:
-                # Unix implementation
-                if select.select([sys.stdin], [], [], 0)[0]:
-                    return sys.stdin.read(1) == '\n'
-                return False
-            
-        # Save terminal settings on Unix systems
-        if sys.platform != "win32":
-            old_settings = termios.tcgetattr(sys.stdin)
-            
+            # Each line is one Enter press; EOF ends the loop without stopping a search
+            for _ in sys.stdin:
+                self._enter_pressed.set()
+
+    def _stream_hits(self, query: CompiledQuery, stop_event: threading.Event) -> Iterator[FileHit]:
+        """Run the parallel walk, yielding hits as they come off the results queue"""
+        get = self.results_queue.get
+
+        self.should_stop = False
+        executor = self._make_executor()
+        futures = self._start_walkers(executor, query)
         try:
-            # Set terminal to raw mode on Unix systems
-            if sys.platform != "win32":
-                tty.setraw(sys.stdin.fileno())
-            
-            self.results = []
-            search_path = Path(params["path"])
-            pattern = params["pattern"]
-            max_results = self.config.get("max_results", 1000)
-            
-            # Debug output
-            self.console.print(f"\n[dim]Searching in: {search_path}[/dim]")
-            self.console.print(f"[dim]Pattern: {pattern}[/dim]")
-            self.console.print("[dim]Press Enter to stop search and show results...[/dim]\n")
-            
-            # Initialize params with defaults
-            params.setdefault("extensions", [])
-            params.setdefault("min_size", None)
-            params.setdefault("max_size", None)
-            params.setdefault("exclude", [])
-            
-            search_stopped = False
-            
-            if params.get("dirs_only"):
-                # Optimized directory search
-                for root, dirs, _ in os.walk(search_path):
-                    if search_stopped or len(self.results) >= max_results:
-                        break
-                        
-                    if is_enter_pressed():
-                        search_stopped = True
+            while True:
+                if stop_event.is_set():
+                    self.search_stopped = True
+                    break
+                try:
+                    hit = get(timeout=0.1)
+                except queue.Empty:
+                    if all(f.done() for f in futures) and self.results_queue.empty():
                         break
-                        
-                    # Skip excluded directories early
-                    root_path = Path(root)
-                    if any(excl in str(root_path).split(os.sep) for excl in self.config.get("default_excludes", self.DEFAULT_EXCLUDES)):
+                    continue
+                yield hit
+        finally:
+            # Let the walkers bail out, then drop anything they queued after we stopped
+            self.should_stop = True
+            executor.shutdown(wait=True)
+            while not self.results_queue.empty():
+                self.results_queue.get_nowait()
+        for future in futures:
+            future.result()
+
+    @staticmethod
+    def _is_refinement(new: CompiledQuery, old: CompiledQuery) -> bool:
+        """Check if every hit of new is guaranteed to be among the hits of old"""
+        if (new.bytes_mode, new.root, new.dirs_only, new.max_depth, new.follow_symlinks, new.content_size_limit) != \
+                (old.bytes_mode, old.root, old.dirs_only, old.max_depth, old.follow_symlinks, old.content_size_limit):
+            return False
+        if not (new.exclude_set >= old.exclude_set and set(new.exclude_globs) >= set(old.exclude_globs)):
+            return False
+
+        # Name filters
+        if new.pattern_norm != old.pattern_norm:
+            return False
+        if old.name_needle is not None and (new.name_needle is None or old.name_needle not in new.name_needle):
+            return False
+        if old.name_needle is None and old.name_re is not None and \
+                (new.name_re is None or new.name_re.pattern != old.name_re.pattern):
+            return False
+
+        # Extension and size filters
+        if old.ext_tuple and not (new.ext_tuple and set(new.ext_tuple) <= set(old.ext_tuple)):
+            return False
+        if new.min_size < old.min_size:
+            return False
+        if old.max_size is not None and (new.max_size is None or new.max_size > old.max_size):
+            return False
+
+        # Content filters: a literal may grow, anything else must be unchanged
+        if old.literal is not None:
+            return (new.literal is not None and old.literal in new.literal
+                    and new.literal_fold == old.literal_fold)
+        if old.content_re is not None:
+            return new.content_re is not None and new.content_re.pattern == old.content_re.pattern \
+                and new.content_re.flags == old.content_re.flags
+        if old.content_fuzzy is not None:
+            return new.content_fuzzy == old.content_fuzzy
+        return True
+
+    def _refilter(self, hits: List[FileHit], query: CompiledQuery) -> Iterator[FileHit]:
+        """Apply a refined query to the hits of a previous search"""
+        native = os.fsencode if query.bytes_mode else str
+        sep = native(os.sep)
+        for hit in hits:
+            path = native(hit.path)
+            parts = path.split(sep)
+            if not query.dirs_only:
+                parts = parts[:-1]
+            if not query.exclude_set.isdisjoint(parts) or \
+                    (query.exclude_re is not None and any(query.exclude_re.match(part) for part in parts)):
+                continue
+
+            name = os.path.basename(path)
+            if query.name_re is not None and query.name_re.search(name) is None:
+                continue
+            if query.pattern_norm is not None and \
+                    self._score(query.pattern_norm, hit.path.rsplit(os.sep, 1)[-1].lower(), query.fuzzy_threshold) < query.fuzzy_threshold:
+                continue
+
+            full_path = os.path.join(query.root, path)
+            try:
+                stat = os.stat(full_path, follow_symlinks=query.follow_symlinks)
+            except OSError:
+                continue
+            if not query.dirs_only and not self.should_include_file(full_path, query, stat):
+                continue
+            yield FileHit(hit.path, stat.st_size, stat.st_mtime_ns, hit.type)
+
+    def _worker_count(self) -> int:
+        """Number of walker threads; one when parallel search is disabled"""
+        if not self.config.get("parallel_search", True):
+            return 1
+        return self.config.get("max_workers") or os.cpu_count() or 1
+
+    def _make_executor(self) -> ThreadPoolExecutor:
+        """Create the walker pool, with room for the root-entries task next to the walkers"""
+        return ThreadPoolExecutor(max_workers=self._worker_count() + 1)
+
+    def _start_walkers(self, executor: ThreadPoolExecutor, query: CompiledQuery) -> list:
+        """Start the walkers on a shared stack of top-level subdirectories, plus one task for the root's own entries"""
+        root_entries = []
+        subdirs = []
+        seen = set()
+        try:
+            if query.follow_symlinks:
+                root_stat = os.stat(query.root)
+                seen.add((root_stat.st_dev, root_stat.st_ino))
+            with os.scandir(query.root) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=query.follow_symlinks)
+                    except OSError:
                         continue
-                    
-                    # Filter dirs list in-place to skip excluded ones
-                    dirs[:] = [d for d in dirs if not any(
-                        excl in str(Path(root) / d)
-                        for excl in self.config.get("default_excludes", self.DEFAULT_EXCLUDES)
-                    )]
-                    
-                    for dir_name in dirs:
-                        if pattern == "*" or pattern[1:-1].lower() in dir_name.lower():
-                            dir_path = root_path / dir_name
+                    if is_dir:
+                        if entry.name in query.exclude_set or \
+                                (query.exclude_re is not None and query.exclude_re.match(entry.name)):
+                            continue
+                        if query.follow_symlinks:
                             try:
-                                relative_path = dir_path.relative_to(search_path)
-                                stat = dir_path.stat()
-                                result = {
-                                    "path": str(relative_path),
-                                    "size": "DIR",
-                                    "modified": datetime.fromtimestamp(stat.st_mtime).strftime(
-                                        self.config.get("date_format", "%Y-%m-%d %H:%M")
-                                    ),
-                                    "type": "directory"
-                                }
-                                self.results.append(result)
-                                self.console.print(f"[green]Found:[/green] {relative_path}")
-                                
-                                if len(self.results) >= max_results:
-                                    break
-                            except (ValueError, OSError):
+                                dir_stat = entry.stat()
+                            except OSError:
                                 continue
-            else:
-                # File search
-                for root, _, files in os.walk(search_path):
-                    if search_stopped or len(self.results) >= max_results:
-                        break
-                        
-                    if is_enter_pressed():
-                        search_stopped = True
-                        break
-                        
-                    root_path = Path(root)
-                    if any(excl in str(root_path).split(os.sep) for excl in self.config.get("default_excludes", self.DEFAULT_EXCLUDES)):
-                        continue
-                        
-                    for file in files:
-                        if pattern == "*" or pattern[1:-1].lower() in file.lower():
-                            file_path = root_path / file
-                            if self.should_include_file(file_path, params):
+                            key = (dir_stat.st_dev, dir_stat.st_ino)
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                        if query.max_depth is None or query.max_depth > 0:
+                            subdirs.append((entry.path, 1))
+                        if query.dirs_only:
+                            root_entries.append(entry)
+                    elif not query.dirs_only and entry.is_file(follow_symlinks=query.follow_symlinks):
+                        root_entries.append(entry)
+        except OSError:
+            pass
+
+        futures = [executor.submit(self._walk, root_entries, query)]
+        if subdirs:
+            # Reversed so the stack hands out the top-level directories in listing order
+            work = _DirStack(subdirs[::-1], lambda: self.should_stop, seen)
+            # Every walker starts even with few top-level directories: a single child
+            # like src/ fans out through the shared stack, and idle walkers exit on their own
+            for _ in range(self._worker_count()):
+                subtree = self._iter_files(
+                    work, query.exclude_set, query.exclude_re,
+                    max_depth=query.max_depth, follow_symlinks=query.follow_symlinks,
+                    dirs_only=query.dirs_only, name_needle=query.name_needle
+                )
+                futures.append(executor.submit(self._walk, subtree, query))
+        return futures
+
+    def _walk(self, entries, query: CompiledQuery):
+        """Filter walker entries and push matches onto the results queue"""
+        # Bind everything the loop touches to locals (LOAD_FAST instead of global/attr lookups)
+        put = self.results_queue.put
+        should_include = self.should_include_file
+        fsdecode = os.fsdecode
+        score = self._score
+        name_search = query.name_re.search if query.name_re is not None else None
+        pattern_norm = query.pattern_norm
+        threshold = query.fuzzy_threshold
+        follow_symlinks = query.follow_symlinks
+        dirs_only = query.dirs_only
+        result_type = "directory" if dirs_only else "file"
+        # Entry paths always extend the root, so slicing replaces os.path.relpath
+        prefix_len = len(os.path.join(query.root, query.root[:0]))
+        for entry in entries:
+            if self.should_stop:
+                return
+            if name_search is not None and name_search(entry.name) is None:
+                continue
+            if pattern_norm is not None and score(pattern_norm, entry.name.lower(), threshold) < threshold:
+                continue
+            # Name-only filters run before the stat inside should_include_file
+            if not dirs_only and not should_include(entry, query):
+                continue
+            try:
+                stat = entry.stat(follow_symlinks=follow_symlinks)
+            except OSError:
+                continue
+            # Decode once per kept hit rather than once per scanned entry
+            put(FileHit(fsdecode(entry.path[prefix_len:]), stat.st_size, stat.st_mtime_ns, result_type))
+
+    def _get_bloom(self, key: tuple) -> Optional[TrigramBloom]:
+        """Look up a directory's name filter, marking it as recently used"""
+        with self._dir_bloom_lock:
+            bloom = self._dir_bloom.get(key)
+            if bloom is not None:
+                self._dir_bloom.move_to_end(key)
+            return bloom
+
+    def _put_bloom(self, key: tuple, bloom: TrigramBloom):
+        """Store a directory's name filter, evicting the least recently used ones"""
+        limit = self.config.get("dir_filter_cache", 0)
+        with self._dir_bloom_lock:
+            self._dir_bloom[key] = bloom
+            while len(self._dir_bloom) > limit:
+                self._dir_bloom.popitem(last=False)
+
+    def _iter_files(self, work: _DirStack, excludes: frozenset, exclude_re: Optional[Pattern],
+                    max_depth: Optional[int] = None, follow_symlinks: bool = False,
+                    dirs_only: bool = False, name_needle: Optional[str] = None):
+        """Walk the directories on the shared work stack with os.scandir, pruning excluded ones before descending.
+
+        Yields files, or directories when dirs_only is set, as os.DirEntry objects
+        so callers can reuse the cached type and stat information. When
+        dir_filter_cache is enabled and the name needle has three or more
+        characters, directories whose cached trigram filter rules the needle out
+        still get descended into, but their own entries are not yielded.
+        """
+        # The filters cost a stat and the trigrams of every name and only pay off on a
+        # later search in the same process, so one-shot CLI runs leave them off
+        use_filters = self.config.get("dir_filter_cache", 0) > 0
+        needle_trigrams = trigrams(name_needle) if use_filters and name_needle and len(name_needle) >= 3 else None
+        scandir = os.scandir
+        stat = os.stat
+        push = work.push
+        pop = work.pop
+        visit = work.visit
+        while True:
+            item = pop()
+            if item is None:
+                return
+            path, depth = item
+            try:
+                skip_entries = False
+                names = None
+                if needle_trigrams is not None:
+                    # The directory mtime changes whenever entries are added, removed or renamed
+                    key = (path, stat(path).st_mtime_ns)
+                    bloom = self._get_bloom(key)
+                    if bloom is None:
+                        names = set()
+                    else:
+                        skip_entries = not bloom.might_contain_all(needle_trigrams)
+
+                descend = max_depth is None or depth < max_depth
+                with scandir(path) as it:
+                    for entry in it:
+                        if names is not None:
+                            names.update(trigrams(entry.name.lower()))
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                        except OSError:
+                            continue
+                        if is_dir:
+                            name = entry.name
+                            if name in excludes or (exclude_re is not None and exclude_re.match(name)):
+                                continue
+                            if follow_symlinks:
+                                # Skip links back to a directory the walk already reached
                                 try:
-                                    relative_path = file_path.relative_to(search_path)
-                                    stat = file_path.stat()
-                                    result = {
-                                        "path": str(relative_path),
-                                        "size": self.format_size(stat.st_size),
-                                        "modified": datetime.fromtimestamp(stat.st_mtime).strftime(
-                                            self.config.get("date_format", "%Y-%m-%d %H:%M")
-                                        ),
-                                        "type": "file"
-                                    }
-                                    self.results.append(result)
-                                    self.console.print(f"[green]Found:[/green] {relative_path}")
-                                    
-                                    if len(self.results) >= max_results:
-                                        break
-                                except (ValueError, OSError):
+                                    dir_stat = entry.stat()
+                                except OSError:
                                     continue
-            
-            if search_stopped:
-                self.console.print("\n[yellow]Search stopped by user[/yellow]")
-            elif len(self.results) >= max_results:
-                self.console.print("\n[yellow]Maximum results limit reached[/yellow]")
-                
-            # Sort results
-            sort_key = params.get("sort_by", self.config.get("sort_by", "path"))
-            reverse = params.get("sort_reverse", self.config.get("sort_reverse", False))
-            self.results.sort(key=lambda x: x[sort_key], reverse=reverse)
-            
-            # Add previews if requested (only for the first few results to keep it fast)
-            if params.get("preview", self.config.get("show_preview", True)):
-                for result in islice(self.results, 10):  # Only preview first 10 results
-                    if result["type"] == "file":
-                        result["preview"] = self.preview_file(Path(search_path) / result["path"])
-                        
-            self.console.print(f"\n[dim]Found {len(self.results)} results[/dim]")
-            
-        finally:
-            # Restore terminal settings on Unix systems
-            if sys.platform != "win32":
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                                if not visit((dir_stat.st_dev, dir_stat.st_ino)):
+                                    continue
+                            if descend:
+                                push((entry.path, depth + 1))
+                            if dirs_only and not skip_entries:
+                                yield entry
+                        elif not dirs_only and not skip_entries and entry.is_file(follow_symlinks=follow_symlinks):
+                            yield entry
+
+                if names is not None:
+                    self._put_bloom(key, TrigramBloom(names))
+            except OSError:
+                continue
+            finally:
+                work.done()
 
-    def _search_directories(self, pattern: str, path: Path) -> List[dict]:
+    def _search_directories(self, pattern: str, path: str) -> List[dict]:
         """Optimized directory search"""
         results = []
         pattern = pattern.rstrip('/')  # Remove trailing slash if present
+        pattern_lower = pattern.lower()
+        exclude_names = self._exclude_names
+        exclude_re = self._exclude_re
+        date_format = self.config.get("date_format", "%Y-%m-%d %H:%M")
         
         # Debug output for directory search
         self.console.print(f"[dim]Looking for directories matching: {pattern}[/dim]")
         
-        for root, dirs, _ in os.walk(path):
-            root_path = Path(root)
-            
-            # Skip excluded directories
-            if any(excl in str(root_path).split(os.sep) for excl in self.config.get("default_excludes", self.DEFAULT_EXCLUDES)):
+        # Excluded directories are pruned by name before scandir ever opens them
+        for entry in scan_tree(path, lambda d: d.name in exclude_names):
+            try:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+            except OSError:
                 continue
-                
-            for dir_name in dirs:
-                # Simple name matching first
-                if pattern.lower() in dir_name.lower():
-                    dir_path = root_path / dir_name
+            # Simple name matching first
+            if pattern_lower in entry.name.lower():
+                try:
+                    relative_path = os.path.relpath(entry.path, path)
+                    # Skip if path matches any exclude pattern
+                    if exclude_re is not None and exclude_re.match(relative_path):
+                        continue
+                        
                     try:
-                        relative_path = dir_path.relative_to(path)
-                        # Skip if path matches any exclude pattern
-                        if any(fnmatch.fnmatch(str(relative_path), excl) for excl in self.config.get("default_excludes", self.DEFAULT_EXCLUDES)):
-                            continue
-                            
-                        try:
-                            stat = dir_path.stat()
-                            results.append({
-                                "path": str(relative_path),
-                                "size": "DIR",
-                                "modified": datetime.fromtimestamp(stat.st_mtime).strftime(
-                                    self.config.get("date_format", "%Y-%m-%d %H:%M")
-                                ),
-                                "type": "directory"
-                            })
-                            # Debug output for found directory
-                            self.console.print(f"[dim]Found directory: {relative_path}[/dim]")
-                        except OSError:
-                            continue
-                    except ValueError:
+                        stat = entry.stat(follow_symlinks=False)
+                        results.append({
+                            "path": relative_path,
+                            "size": "DIR",
+                            "modified": time.strftime(date_format, time.localtime(stat.st_mtime)),
+                            "type": "directory"
+                        })
+                        # Debug output for found directory
+                        self.console.print(f"[dim]Found directory: {relative_path}[/dim]")
+                    except OSError:
                         continue
+                except ValueError:
+                    continue
                     
         if not results:
             self.console.print("[yellow]No directories found matching the pattern[/yellow]")
@@ -1,24 +1,119 @@
 """
 Optimized search implementations for the Findr tool.
 """
-from typing import List, Dict, Set
+from typing import AnyStr, Callable, Iterator, List, Dict, Optional, Set, Tuple
+import mmap
 import os
-from pathlib import Path
 import platform
 import re
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
-from thefuzz import fuzz
+import subprocess
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from rapidfuzz import fuzz, process
 import fnmatch
+import functools
+
+def trigrams(text: AnyStr) -> Set[AnyStr]:
+    """All length-3 windows of text (str or bytes)"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def match_batch(names: List[AnyStr], needle: AnyStr) -> List[int]:
+    """Indices of the names containing needle (already lowercase), ignoring case.
+
+    The names are joined with NUL, which no file name contains, and lowercased
+    in one call; each hit is then located with find and count, so the Python
+    loop runs once per match rather than once per name.
+    """
+    if not needle:
+        return list(range(len(names)))
+    sep = b'\0' if isinstance(needle, bytes) else '\0'
+    text = sep.join(names).lower()
+    find = text.find
+    count = text.count
+    matches = []
+    index = 0
+    start = 0
+    pos = find(needle)
+    while pos != -1:
+        index += count(sep, start, pos)
+        matches.append(index)
+        start = find(sep, pos)
+        if start == -1:
+            break
+        pos = find(needle, start)
+    return matches
+
+def _split_excludes(patterns) -> Tuple[frozenset, tuple]:
+    """Split exclude patterns into plain names (a set lookup) and glob patterns (fnmatch)"""
+    names = set()
+    globs = []
+    for excl in patterns:
+        if any(c in excl for c in "*?[{"):
+            globs.append(excl)
+        else:
+            names.add(excl)
+    return frozenset(names), tuple(globs)
+
+def scan_tree(root: str, skip_dir: Optional[Callable[[os.DirEntry], bool]] = None) -> Iterator[os.DirEntry]:
+    """Yield every entry under root via os.scandir, never descending into directories skip_dir rejects"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if skip_dir is not None and skip_dir(entry):
+                                continue
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+                    yield entry
+        except OSError:
+            continue
+
+class TrigramBloom:
+    """Bloom filter over the trigrams of the entry names in one directory"""
+    __slots__ = ("_bits", "_mask")
+
+    def __init__(self, items: Set[AnyStr]):
+        # ~8 bits per trigram with two probes keeps false positives around 5%
+        size = 512
+        while size < 8 * len(items):
+            size <<= 1
+        self._mask = size - 1
+        self._bits = bytearray(size >> 3)
+        for item in items:
+            for pos in self._positions(item):
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def _positions(self, item: AnyStr):
+        h = hash(item)
+        return h & self._mask, (h >> 24) & self._mask
+
+    def might_contain_all(self, items: Set[AnyStr]) -> bool:
+        """False if at least one item is definitely not in the filter"""
+        bits = self._bits
+        for item in items:
+            for pos in self._positions(item):
+                if not bits[pos >> 3] & (1 << (pos & 7)):
+                    return False
+        return True
 
 class SearchOptimizer:
     def __init__(self, config: dict):
         self.config = config
         self.is_windows = platform.system() == "Windows"
         self._file_cache: Dict[str, Set[str]] = {}
-        self._content_cache: Dict[str, str] = {}
+        # Excludes split once rather than per search: names are pruned by set lookup, globs by fnmatch
+        self._exclude_names, self._exclude_globs = _split_excludes(config.get("default_excludes", []))
+        # Bounded memo of per-file match counts (small ints, never file contents)
+        if config.get("use_cache", True):
+            self._match_count = functools.lru_cache(maxsize=1024)(self._count_matches)
+        else:
+            self._match_count = self._count_matches
         
-    def quick_file_search(self, pattern: str, path: Path) -> List[dict]:
+    def quick_file_search(self, pattern: str, path: str) -> List[dict]:
         """Fast file search using OS-specific optimizations"""
         results = []
         max_results = self.config["max_results"]
@@ -45,15 +140,14 @@ class SearchOptimizer:
                     
         # Format results
         formatted_results = []
+        date_format = self.config["date_format"]
         for file_path in results[:max_results]:
             try:
-                stat = Path(file_path).stat()
+                stat = os.stat(file_path)
                 formatted_results.append({
-                    "path": str(Path(file_path).relative_to(path)),
+                    "path": os.path.relpath(file_path, path),
                     "size": self._format_size(stat.st_size),
-                    "modified": datetime.fromtimestamp(stat.st_mtime).strftime(
-                        self.config["date_format"]
-                    ),
+                    "modified": time.strftime(date_format, time.localtime(stat.st_mtime)),
                     "type": "file"
                 })
             except OSError:
@@ -61,68 +155,75 @@ class SearchOptimizer:
                 
         return formatted_results
         
-    def quick_content_search(self, pattern: str, path: Path) -> List[dict]:
+    def quick_content_search(self, pattern: str, path: str) -> List[dict]:
         """Fast content search using parallel processing"""
         results = []
         max_results = self.config["max_results"]
         
-        # Compile regex pattern
+        # Compile a bytes regex so files are matched on their mapped bytes
         try:
-            regex = re.compile(pattern)
+            regex = re.compile(pattern.encode('utf-8'))
         except re.error:
-            regex = re.compile(re.escape(pattern))
-            
-        # Use ThreadPoolExecutor for parallel search
-        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
-            futures = []
-            
-            for root, _, files in os.walk(path):
-                root_path = Path(root)
-                
-                # Skip excluded directories
-                if any(excl in str(root_path).parts 
-                      for excl in self.config["default_excludes"]):
-                    continue
-                    
+            regex = re.compile(re.escape(pattern.encode('utf-8')))
+
+        excludes = self._exclude_names
+        size_limit = self.config["binary_size_limit"]
+        join = os.path.join
+        getsize = os.path.getsize
+
+        def candidates():
+            # followlinks=False (the default) keeps symlink cycles from looping the walk
+            for root, dirs, files in os.walk(path, topdown=True, followlinks=False):
+                # Prune excluded directories in place so os.walk never descends into them
+                dirs[:] = [d for d in dirs if d not in excludes]
+
                 for file in files:
-                    file_path = root_path / file
-                    if len(results) >= max_results:
-                        break
-                        
+                    file_path = join(root, file)
                     # Skip large binary files
                     try:
-                        if (file_path.stat().st_size > 
-                            self.config["binary_size_limit"]):
+                        if getsize(file_path) > size_limit:
                             continue
                     except OSError:
                         continue
-                        
-                    futures.append(
-                        executor.submit(
-                            self._search_file_content,
-                            file_path,
-                            regex,
-                            path
-                        )
-                    )
-                    
-            # Collect results
-            for future in futures:
-                if result := future.result():
-                    results.append(result)
+                    yield file_path
+            
+        # Keep at most a few files per worker in flight and collect them as they finish,
+        # so matches arrive while the tree is still being walked
+        workers = os.cpu_count() or 1
+        window = 4 * workers
+        executor = ThreadPoolExecutor(max_workers=workers)
+        pending = set()
+        try:
+            for file_path in candidates():
+                pending.add(executor.submit(self._search_file_content, file_path, regex, path))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    results.extend(result for result in (future.result() for future in done) if result)
                     if len(results) >= max_results:
                         break
+            else:
+                for future in as_completed(pending):
+                    result = future.result()
+                    if result:
+                        results.append(result)
+                        if len(results) >= max_results:
+                            break
+        finally:
+            # Drop queued work once the limit is reached (shutdown's cancel_futures needs 3.9)
+            for future in pending:
+                future.cancel()
+            executor.shutdown()
                         
-        return results
+        return results[:max_results]
         
-    def _windows_file_search(self, pattern: str, path: Path) -> List[str]:
+    def _windows_file_search(self, pattern: str, path: str) -> List[str]:
         """Use Windows Search API for fast file search"""
         import win32file
         import win32con
         
         results = []
         handle = win32file.FindFirstFile(
-            str(path / "**" / "*.*"),
+            os.path.join(path, "**", "*.*"),
             win32con.FILE_ATTRIBUTE_NORMAL
         )
         
@@ -133,107 +234,116 @@ class SearchOptimizer:
                     break
                     
                 file_name = data[8]
-                if fuzz.ratio(file_name, pattern) >= self.config["fuzzy_threshold"]:
-                    results.append(str(path / file_name))
+                threshold = self.config["fuzzy_threshold"]
+                if fuzz.ratio(file_name, pattern, score_cutoff=threshold) >= threshold:
+                    results.append(os.path.join(path, file_name))
         finally:
             win32file.FindClose(handle)
             
         return results
         
-    def _unix_file_search(self, pattern: str, path: Path) -> List[str]:
+    def _unix_file_search(self, pattern: str, path: str) -> List[str]:
         """Use find/locate commands for fast file search on Unix systems"""
-        import subprocess
-        
-        results = []
         try:
-            # Try using locate first (faster but requires updatedb)
-            cmd = f"locate -r '{pattern}' | grep '^{path}'"
-            output = subprocess.check_output(
-                cmd, 
-                shell=True, 
-                text=True
-            ).splitlines()
-            results.extend(output)
-        except:
-            # Fall back to find
-            cmd = f"find {path} -type f -name '*{pattern}*'"
-            output = subprocess.check_output(
-                cmd,
-                shell=True,
-                text=True
-            ).splitlines()
-            results.extend(output)
-            
+            # Try using locate first (faster but requires updatedb); it prints absolute paths
+            prefix = os.path.join(os.path.abspath(path), "")
+            results = self._command_lines(["locate", "-r", pattern], prefix)
+            # Nothing under path counts as a miss too: the database may be stale, or every match elsewhere
+            if results:
+                return results
+        except (OSError, subprocess.CalledProcessError):
+            pass
+        # Fall back to find (when locate is missing, fails or finds nothing under path)
+        return self._command_lines(["find", path, "-type", "f", "-name", f"*{pattern}*"])
+
+    def _command_lines(self, cmd: List[str], prefix: str = "") -> List[str]:
+        """Stream a command's output lines starting with prefix, stopping at max_results.
+
+        Runs without a shell, so the pattern is never shell-parsed. Raises
+        CalledProcessError when the command fails without producing any lines.
+        """
+        limit = self.config["max_results"]
+        results = []
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+            for line in proc.stdout:
+                if line.startswith(prefix):
+                    results.append(line.rstrip("\n"))
+                    if len(results) >= limit:
+                        proc.kill()
+                        break
+        if not results and proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
         return results
         
-    def _fallback_file_search(self, pattern: str, path: Path) -> List[str]:
+    def _fallback_file_search(self, pattern: str, path: str) -> List[str]:
         """Standard file search implementation as fallback"""
         results = []
+        exclude_names = self._exclude_names
         
-        for root, _, files in os.walk(path):
-            root_path = Path(root)
-            
-            # Skip excluded directories
-            if any(excl in str(root_path).split(os.sep) 
-                  for excl in self.config.get("default_excludes", [])):
+        # Excluded directories are pruned by a set lookup before they are descended into
+        files = []
+        for entry in scan_tree(path, lambda d: d.name in exclude_names):
+            try:
+                if not entry.is_dir(follow_symlinks=False):
+                    files.append(entry)
+            except OSError:
                 continue
-                
-            for file in files:
-                file_path = root_path / file
-                try:
-                    relative_path = file_path.relative_to(path)
-                    if any(fnmatch.fnmatch(str(relative_path), excl) 
-                          for excl in self.config.get("default_excludes", [])):
-                        continue
-                        
-                    if fuzz.ratio(file, pattern) >= self.config.get("fuzzy_threshold", 65):
-                        results.append({
-                            "path": str(relative_path),
-                            "size": self._format_size(file_path.stat().st_size),
-                            "modified": datetime.fromtimestamp(file_path.stat().st_mtime).strftime(
-                                self.config.get("date_format", "%Y-%m-%d %H:%M")
-                            ),
-                            "type": "file"
-                        })
-                except (ValueError, OSError):
-                    continue
+
+        # Score every name in one batched call; only names at or above the cutoff come back
+        matches = process.extract(
+            pattern, [entry.name for entry in files], scorer=fuzz.ratio,
+            score_cutoff=self.config.get("fuzzy_threshold", 65), limit=None
+        )
+        for _, _, index in matches:
+            entry = files[index]
+            try:
+                relative_path = os.path.relpath(entry.path, path)
+            except ValueError:
+                continue
+            if any(fnmatch.fnmatch(relative_path, excl) for excl in self._exclude_globs):
+                continue
+            # Plain paths like the locate/find searches; quick_file_search stats each kept one once
+            results.append(entry.path)
                     
         return results
         
     def _search_file_content(
         self, 
-        file_path: Path, 
+        file_path: str, 
         pattern: re.Pattern, 
-        base_path: Path
+        base_path: str
     ) -> Dict:
-        """Search file content with caching"""
+        """Search memory-mapped file content with a bytes pattern"""
         try:
-            # Check cache first
-            cache_key = str(file_path)
-            if cache_key in self._content_cache:
-                content = self._content_cache[cache_key]
-            else:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Cache if file is small enough
-                    if len(content) <= self.config["cache_size_limit"]:
-                        self._content_cache[cache_key] = content
-                        
-            if pattern.search(content):
-                stat = file_path.stat()
-                return {
-                    "path": str(file_path.relative_to(base_path)),
-                    "size": self._format_size(stat.st_size),
-                    "modified": datetime.fromtimestamp(stat.st_mtime).strftime(
-                        self.config["date_format"]
-                    ),
-                    "type": "file",
-                    "matches": len(pattern.findall(content))
-                }
-        except (OSError, UnicodeDecodeError):
-            pass
-            
-        return None
+            stat = os.stat(file_path)
+            if stat.st_size == 0:
+                return None
+            # mtime and size in the key make an edited file a cache miss
+            matches = self._match_count(file_path, stat.st_mtime_ns, stat.st_size, pattern)
+        except (OSError, ValueError):
+            return None
+        if not matches:
+            return None
+        return {
+            "path": os.path.relpath(file_path, base_path),
+            "size": self._format_size(stat.st_size),
+            "modified": time.strftime(self.config["date_format"], time.localtime(stat.st_mtime)),
+            "type": "file",
+            "matches": matches
+        }
+
+    @staticmethod
+    def _count_matches(file_path: str, mtime_ns: int, size: int, pattern: re.Pattern) -> int:
+        """Number of pattern matches in the file's mapped bytes (mtime_ns and size only key the cache)"""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            # The kernel pages in only what the regex touches; no heap copy of the file
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                if not pattern.search(mm):
+                    return 0
+                return sum(1 for _ in pattern.finditer(mm))
+        finally:
+            os.close(fd)
         
     def _format_size(self, size: int) -> str:
         """Format file size in human readable format"""
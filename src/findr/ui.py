@@ -1,21 +1,95 @@
 """
 User interface components using questionary.
 """
-import questionary
+import functools
+import re
+import time
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
-from rich.markdown import Markdown
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Iterable, List, Optional
 import sys
 
-class UI:
-    def __init__(self):
-        self.console = Console()
+# Characters that make a name a glob; plain names get wrapped in '*...*'
+_HAS_WILDCARD = re.compile(r"[*?\[{]").search
 
-    def show_help(self):
-        """Display help information"""
-        help_text = """
+# Splits comma-separated answers, dropping the whitespace around each item
+_CSV_SPLIT = re.compile(r"\s*,\s*").split
+
+# Prompt choices are constant, so they are built once at import
+_PATH_STYLE_RULES = [
+    ('question', 'fg:cyan bold'),
+    ('path', 'fg:green'),
+    ('selected', 'fg:white bg:blue')
+]
+
+# Every search parameter the prompts and the search engine read, so lookups never miss
+_DEFAULT_PARAMS = MappingProxyType({
+    "path": None,
+    "pattern": "*",
+    "dirs_only": False,
+    "preview": True,
+    "exclude": (),
+    "extensions": (),
+    "min_size": None,
+    "max_size": None,
+    "content_pattern": None
+})
+
+_INTRO_PROMPT = "\n[cyan]Press h for help, q to quit, or Enter to continue: [/cyan]"
+
+# Labels are only for display; the values select the prompt in UI._SEARCH_HANDLERS
+_SEARCH_TYPE_CHOICES = (
+    {"name": "🔍 Find files by name", "value": "name"},
+    {"name": "📝 Find text inside files", "value": "content"},
+    {"name": "📁 Find folders only", "value": "folders"},
+    {"name": "🎯 Find files by type (*.py, *.js, etc)", "value": "file_type"},
+    {"name": "✨ Custom search pattern", "value": "custom"}
+)
+
+# File type choices, in display order, mapped to their patterns
+_PATTERN_MAP = MappingProxyType({
+    "🐍 Python files (*.py)": "*.py",
+    "📜 JavaScript files (*.js, *.jsx)": "*.{js,jsx}",
+    "📘 TypeScript files (*.ts, *.tsx)": "*.{ts,tsx}",
+    "🌐 Web files (*.html, *.css)": "*.{html,css,scss,sass}",
+    "⚙️ Config files (*.json, *.yaml, etc)": "*.{json,yaml,yml,toml,ini,conf}",
+    "📝 Documentation (*.md, *.txt)": "*.{md,mdx,rst,txt}",
+    "🖼️ Images (*.jpg, *.png, etc)": "*.{jpg,jpeg,png,gif,svg,webp}",
+    "🎵 Media files (*.mp3, *.mp4, etc)": "*.{mp3,mp4,wav,avi,mkv}",
+    "📦 Archive files (*.zip, *.tar, etc)": "*.{zip,tar,gz,7z,rar}"
+})
+_FILE_TYPE_CHOICES = tuple(_PATTERN_MAP)
+
+_SIZE_CHOICES = (
+    "📊 No size filter",
+    "🔽 Small files (< 100KB)",
+    "➡️ Medium files (100KB - 10MB)",
+    "🔼 Large files (> 10MB)",
+    "⚖️ Custom size range"
+)
+
+# Shown above the custom pattern prompt, printed in one write
+_CUSTOM_HELP = (
+    "\n[cyan]Search Pattern Help:[/cyan]\n"
+    "- [yellow]*.txt[/yellow] finds all .txt files\n"
+    "- [yellow]*test*[/yellow] finds files containing 'test'\n"
+    "- [yellow]*.{js,ts}[/yellow] finds .js and .ts files\n"
+    "- [yellow]src/*.py[/yellow] finds Python files in src directory"
+)
+
+# Results table columns as (header, style, justify)
+_RESULT_COLS = (
+    ("Path", "cyan", "left"),
+    ("Size", "green", "right"),
+    ("Modified", "yellow", "left"),
+    ("Type", "blue", "left")
+)
+
+_HELP_TEXT = """
 # Findr Help
 
 ## Basic Usage
@@ -51,57 +125,110 @@ class UI:
 - Exclude patterns to skip unwanted files
 - Search history is saved automatically
 """
-        md = Markdown(help_text)
-        self.console.print(Panel(md, title="[bold cyan]Findr Help[/bold cyan]", border_style="cyan"))
-        input("\nPress Enter to continue...")
+
+# Both panels are constant, so they are built once rather than on every display
+_WELCOME_PANEL = Panel(
+    "[bold cyan]Welcome to Findr![/bold cyan]\n\n"
+    "🔍 Interactive file search tool\n"
+    "Press [bold yellow]'h'[/bold yellow] for help or [bold yellow]'q'[/bold yellow] to quit\n"
+    "Use [bold yellow]arrow keys[/bold yellow] to navigate and [bold yellow]Enter[/bold yellow] to select",
+    title="[bold green]Findr[/bold green]",
+    border_style="green"
+)
+
+@functools.lru_cache(maxsize=None)
+def _help_panel() -> Panel:
+    """The help panel, built on first use so rich.markdown is only imported if help is shown"""
+    from rich.markdown import Markdown
+    return Panel(Markdown(_HELP_TEXT), title="[bold cyan]Findr Help[/bold cyan]", border_style="cyan")
+
+@functools.lru_cache(maxsize=None)
+def _path_style():
+    """questionary Style for the directory prompt, built once"""
+    import questionary
+    return questionary.Style(_PATH_STYLE_RULES)
+
+# Seconds a directory-prompt existence check is reused while the user types
+_EXISTS_TTL = 2.0
+
+@functools.lru_cache(maxsize=256)
+def _cached_exists(path: str, epoch: int) -> bool:
+    """Path(path).exists(), memoized per path within one TTL epoch"""
+    return Path(path).exists()
+
+def _path_exists(path: str) -> bool:
+    """Directory prompt validator; questionary runs it on every keystroke, so results are reused briefly"""
+    return _cached_exists(path, int(time.monotonic() // _EXISTS_TTL))
+
+def _make_results_table() -> Table:
+    """Create the empty results table"""
+    table = Table(show_header=True, header_style="bold magenta")
+    for name, style, justify in _RESULT_COLS:
+        table.add_column(name, style=style, justify=justify)
+    return table
+
+async def _to_thread(func, *args):
+    """Run a blocking call on the default executor (asyncio.to_thread needs Python 3.9)"""
+    import asyncio
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+class UI:
+    def __init__(self):
+        self.console = Console()
+
+    def show_help(self):
+        """Display help information, as plain text when it is not going to a styled terminal"""
+        if self.console.is_terminal and not self.console.no_color:
+            self.console.print(_help_panel())
+        else:
+            # Styles would be stripped anyway, so skip parsing and laying out the Markdown
+            self.console.print(_HELP_TEXT, markup=False, highlight=False)
+        try:
+            input("\nPress Enter to continue...")
+        except EOFError:  # stdin closed or not interactive
+            pass
 
     def show_welcome(self):
         """Display welcome message"""
-        welcome = Panel(
-            "[bold cyan]Welcome to Findr![/bold cyan]\n\n"
-            "🔍 Interactive file search tool\n"
-            "Press [bold yellow]'h'[/bold yellow] for help or [bold yellow]'q'[/bold yellow] to quit\n"
-            "Use [bold yellow]arrow keys[/bold yellow] to navigate and [bold yellow]Enter[/bold yellow] to select",
-            title="[bold green]Findr[/bold green]",
-            border_style="green"
-        )
-        self.console.print(welcome)
+        self.console.print(_WELCOME_PANEL)
 
     def prompt_user(self, config: dict, skip_intro: bool = False, initial_params: dict = None) -> dict:
-        """Collect user inputs through interactive prompts"""
+        """Collect user inputs through interactive prompts (blocking shim around prompt_user_async)"""
+        import asyncio  # Like questionary below, only needed once prompting starts
+        return asyncio.run(self.prompt_user_async(config, skip_intro, initial_params))
+
+    async def prompt_user_async(self, config: dict, skip_intro: bool = False, initial_params: dict = None) -> dict:
+        """Collect user inputs through interactive prompts without blocking the event loop"""
+        # Imported here: questionary pulls in prompt_toolkit, which only prompting needs
+        import questionary
+
         if not skip_intro:
             self.show_welcome()
-            while True:
-                key = self.console.input("\n[cyan]Press h for help, q to quit, or Enter to continue: [/cyan]")
-                if key.lower() == 'h':
-                    self.show_help()
-                    continue
-                elif key.lower() == 'q':
+            # Enter continues; 'h' shows help and 'q' quits, anything else asks again
+            key = None
+            while key != '':
+                key = (await _to_thread(self.console.input, _INTRO_PROMPT)).strip().lower()
+                if key == 'h':
+                    await _to_thread(self.show_help)
+                elif key == 'q':
                     sys.exit(0)
-                elif key:
-                    continue
-                break
 
         # Start with root directory selection
         self.console.print("\n[bold cyan]Directory Selection[/bold cyan]")
-        default_path = initial_params.get("path", str(Path.cwd())) if initial_params else str(Path.cwd())
-        search_path = questionary.path(
+        default_path = initial_params["path"] if initial_params and "path" in initial_params else str(Path.cwd())
+        search_path = await questionary.path(
             "Enter the directory to search in:",
             default=default_path,
-            validate=lambda x: Path(x).exists(),
-            style=questionary.Style([
-                ('question', 'fg:cyan bold'),
-                ('path', 'fg:green'),
-                ('selected', 'fg:white bg:blue')
-            ])
-        ).ask()
+            validate=_path_exists,
+            style=_path_style()
+        ).ask_async()
 
         # If using a preset, confirm or modify the preset settings
         if initial_params:
-            use_preset_settings = questionary.confirm(
+            use_preset_settings = await questionary.confirm(
                 "Use preset settings?",
                 default=True
-            ).ask()
+            ).ask_async()
             
             if use_preset_settings:
                 params = initial_params.copy()
@@ -112,150 +239,37 @@ class UI:
         self.console.print("\n[bold cyan]Search Pattern Selection[/bold cyan]")
         
         # First ask for the type of search
-        search_type = questionary.select(
+        search_type = await questionary.select(
             "What type of search?",
-            choices=[
-                "🔍 Find files by name",
-                "📝 Find text inside files",
-                "📁 Find folders only",
-                "🎯 Find files by type (*.py, *.js, etc)",
-                "✨ Custom search pattern"
-            ]
-        ).ask()
-
-        if search_type == "📁 Find folders only":
-            folder_name = questionary.text(
-                "Enter folder name to find:",
-                instruction="Enter name or pattern (e.g., 'findr', '*test*', 'src*', '*lib')"
-            ).ask()
-            # If no wildcards are used, wrap with * for convenience
-            pattern = f"*{folder_name}*" if not any(c in folder_name for c in "*?[{") else folder_name
-            params = {
-                "path": search_path,
-                "pattern": pattern,
-                "dirs_only": True,
-                "preview": False,
-                "exclude": config.get("default_excludes", [])
-            }
-            
-        elif search_type == "🔍 Find files by name":
-            name_pattern = questionary.text(
-                "Enter file name pattern:",
-                instruction="e.g., 'config' finds files containing 'config', '*.txt' finds .txt files"
-            ).ask()
-            pattern = f"*{name_pattern}*" if not any(c in name_pattern for c in "*?[{") else name_pattern
-            params = {
-                "path": search_path,
-                "pattern": pattern,
-                "dirs_only": False,
-                "preview": config.get("show_preview", True),
-                "exclude": config.get("default_excludes", [])
-            }
-            
-        elif search_type == "📝 Find text inside files":
-            content_pattern = questionary.text(
-                "Enter text to search for inside files:",
-                instruction="Enter the text or regex pattern to find"
-            ).ask()
-            
-            file_pattern = questionary.text(
-                "Search in which files? (optional)",
-                default="*",
-                instruction="e.g., '*.py' for Python files, '*.{js,ts}' for JS/TS, or just Enter for all files"
-            ).ask()
-            
-            params = {
-                "path": search_path,
-                "pattern": file_pattern,
-                "content_pattern": content_pattern,
-                "dirs_only": False,
-                "preview": True,  # Always show preview for content search
-                "exclude": config.get("default_excludes", [])
-            }
-            
-        elif search_type == "🎯 Find files by type":
-            file_type = questionary.select(
-                "Which type of files?",
-                choices=[
-                    "🐍 Python files (*.py)",
-                    "📜 JavaScript files (*.js, *.jsx)",
-                    "📘 TypeScript files (*.ts, *.tsx)",
-                    "🌐 Web files (*.html, *.css)",
-                    "⚙️ Config files (*.json, *.yaml, etc)",
-                    "📝 Documentation (*.md, *.txt)",
-                    "🖼️ Images (*.jpg, *.png, etc)",
-                    "🎵 Media files (*.mp3, *.mp4, etc)",
-                    "📦 Archive files (*.zip, *.tar, etc)"
-                ]
-            ).ask()
-
-            # Map selections to patterns
-            pattern_map = {
-                "🐍 Python files (*.py)": "*.py",
-                "📜 JavaScript files (*.js, *.jsx)": "*.{js,jsx}",
-                "📘 TypeScript files (*.ts, *.tsx)": "*.{ts,tsx}",
-                "🌐 Web files (*.html, *.css)": "*.{html,css,scss,sass}",
-                "⚙️ Config files (*.json, *.yaml, etc)": "*.{json,yaml,yml,toml,ini,conf}",
-                "📝 Documentation (*.md, *.txt)": "*.{md,mdx,rst,txt}",
-                "🖼️ Images (*.jpg, *.png, etc)": "*.{jpg,jpeg,png,gif,svg,webp}",
-                "🎵 Media files (*.mp3, *.mp4, etc)": "*.{mp3,mp4,wav,avi,mkv}",
-                "📦 Archive files (*.zip, *.tar, etc)": "*.{zip,tar,gz,7z,rar}"
-            }
-            pattern = pattern_map[file_type]
-            params = {
-                "path": search_path,
-                "pattern": pattern,
-                "dirs_only": False,
-                "preview": config.get("show_preview", True),
-                "exclude": config.get("default_excludes", [])
-            }
-            
-        else:  # Custom search pattern
-            self.console.print("\n[cyan]Search Pattern Help:[/cyan]")
-            self.console.print("- [yellow]*.txt[/yellow] finds all .txt files")
-            self.console.print("- [yellow]*test*[/yellow] finds files containing 'test'")
-            self.console.print("- [yellow]*.{js,ts}[/yellow] finds .js and .ts files")
-            self.console.print("- [yellow]src/*.py[/yellow] finds Python files in src directory")
-            pattern = questionary.text(
-                "Enter custom search pattern:",
-                instruction="Enter your search pattern using wildcards"
-            ).ask()
-            params = {
-                "path": search_path,
-                "pattern": pattern,
-                "dirs_only": pattern.endswith('/'),
-                "preview": config.get("show_preview", True),
-                "exclude": config.get("default_excludes", [])
-            }
+            choices=_SEARCH_TYPE_CHOICES
+        ).ask_async()
+
+        if search_type is None:  # Ctrl+C at the prompt
+            raise KeyboardInterrupt
+        params = await self._SEARCH_HANDLERS[search_type](self, search_path, config)
 
         # Ask about additional filters
-        use_filters = questionary.confirm(
+        use_filters = await questionary.confirm(
             "Would you like to use additional filters?",
             default=False
-        ).ask()
+        ).ask_async()
 
         if use_filters:
             self.console.print("\n[bold cyan]Filter Configuration[/bold cyan]")
             if not params["dirs_only"]:
                 if not params["extensions"]:
-                    extensions = questionary.text(
+                    extensions = await questionary.text(
                         "Enter file extensions to filter (comma-separated, e.g., py,js,txt):",
                         instruction="Leave empty to skip"
-                    ).ask()
+                    ).ask_async()
                     if extensions:
-                        params["extensions"] = [f".{ext.strip()}" for ext in extensions.split(",")]
+                        params["extensions"] = [f".{ext}" for ext in _CSV_SPLIT(extensions.strip()) if ext]
 
                 if not (params["min_size"] or params["max_size"]):
-                    size_choice = questionary.select(
+                    size_choice = await questionary.select(
                         "Filter by file size?",
-                        choices=[
-                            "📊 No size filter",
-                            "🔽 Small files (< 100KB)",
-                            "➡️ Medium files (100KB - 10MB)",
-                            "🔼 Large files (> 10MB)",
-                            "⚖️ Custom size range"
-                        ]
-                    ).ask()
+                        choices=_SIZE_CHOICES
+                    ).ask_async()
 
                     if "Small files" in size_choice:
                         params["max_size"] = "100K"
@@ -265,66 +279,183 @@ class UI:
                     elif "Large files" in size_choice:
                         params["min_size"] = "10M"
                     elif "Custom size range" in size_choice:
-                        min_size = questionary.text(
+                        min_size = await questionary.text(
                             "Enter minimum file size (e.g., 1M, 500K):",
                             instruction="Leave empty to skip"
-                        ).ask()
+                        ).ask_async()
                         if min_size:
                             params["min_size"] = min_size
 
-                        max_size = questionary.text(
+                        max_size = await questionary.text(
                             "Enter maximum file size (e.g., 10M, 1G):",
                             instruction="Leave empty to skip"
-                        ).ask()
+                        ).ask_async()
                         if max_size:
                             params["max_size"] = max_size
 
             if not params["exclude"]:
-                exclude = questionary.text(
+                exclude = await questionary.text(
                     "Enter additional patterns to exclude (comma-separated):",
                     instruction="e.g., *.tmp,build/*"
-                ).ask()
+                ).ask_async()
                 if exclude:
-                    params["exclude"].extend([pat.strip() for pat in exclude.split(",")])
+                    params["exclude"].extend(pat for pat in _CSV_SPLIT(exclude.strip()) if pat)
 
             if not params["content_pattern"]:
-                use_content_search = questionary.confirm(
+                use_content_search = await questionary.confirm(
                     "Would you like to search file contents?",
                     default=False
-                ).ask()
+                ).ask_async()
                 if use_content_search:
-                    params["content_pattern"] = questionary.text(
+                    params["content_pattern"] = await questionary.text(
                         "Enter content search pattern:",
                         instruction="Regular expression or text to search for"
-                    ).ask()
+                    ).ask_async()
 
         return params
 
-    def display_results(self, results: list):
-        """Display search results in a formatted table"""
-        if not results:
-            self.console.print("\n[yellow]No results found[/yellow]")
-            return
+    async def _ask_name(self, search_path: str, config: dict) -> dict:
+        """Prompt for a file name search"""
+        import questionary
+        name_pattern = await questionary.text(
+            "Enter file name pattern:",
+            instruction="e.g., 'config' finds files containing 'config', '*.txt' finds .txt files"
+        ).ask_async()
+        pattern = f"*{name_pattern}*" if _HAS_WILDCARD(name_pattern) is None else name_pattern
+        return {
+            **_DEFAULT_PARAMS,
+            "path": search_path,
+            "pattern": pattern,
+            "dirs_only": False,
+            "preview": config.get("show_preview", True),
+            "exclude": list(config.get("default_excludes", ()))
+        }
+
+    async def _ask_content(self, search_path: str, config: dict) -> dict:
+        """Prompt for a search inside file contents"""
+        import questionary
+        content_pattern = await questionary.text(
+            "Enter text to search for inside files:",
+            instruction="Enter the text or regex pattern to find"
+        ).ask_async()
+
+        file_pattern = await questionary.text(
+            "Search in which files? (optional)",
+            default="*",
+            instruction="e.g., '*.py' for Python files, '*.{js,ts}' for JS/TS, or just Enter for all files"
+        ).ask_async()
+
+        return {
+            **_DEFAULT_PARAMS,
+            "path": search_path,
+            "pattern": file_pattern,
+            "content_pattern": content_pattern,
+            "dirs_only": False,
+            "preview": True,  # Always show preview for content search
+            "exclude": list(config.get("default_excludes", ()))
+        }
+
+    async def _ask_folders(self, search_path: str, config: dict) -> dict:
+        """Prompt for a folder name search"""
+        import questionary
+        folder_name = await questionary.text(
+            "Enter folder name to find:",
+            instruction="Enter name or pattern (e.g., 'findr', '*test*', 'src*', '*lib')"
+        ).ask_async()
+        # If no wildcards are used, wrap with * for convenience
+        pattern = f"*{folder_name}*" if _HAS_WILDCARD(folder_name) is None else folder_name
+        return {
+            **_DEFAULT_PARAMS,
+            "path": search_path,
+            "pattern": pattern,
+            "dirs_only": True,
+            "preview": False,
+            "exclude": list(config.get("default_excludes", ()))
+        }
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Path", style="cyan")
-        table.add_column("Size", style="green", justify="right")
-        table.add_column("Modified", style="yellow")
-        table.add_column("Type", style="blue")
+    async def _ask_file_type(self, search_path: str, config: dict) -> dict:
+        """Prompt for a search by file type"""
+        import questionary
+        file_type = await questionary.select(
+            "Which type of files?",
+            choices=_FILE_TYPE_CHOICES
+        ).ask_async()
+        pattern = _PATTERN_MAP[file_type]
+        return {
+            **_DEFAULT_PARAMS,
+            "path": search_path,
+            "pattern": pattern,
+            "dirs_only": False,
+            "preview": config.get("show_preview", True),
+            "exclude": list(config.get("default_excludes", ()))
+        }
 
-        for result in results:
+    async def _ask_custom(self, search_path: str, config: dict) -> dict:
+        """Prompt for a custom search pattern"""
+        import questionary
+        self.console.print(_CUSTOM_HELP)
+        pattern = await questionary.text(
+            "Enter custom search pattern:",
+            instruction="Enter your search pattern using wildcards"
+        ).ask_async()
+        return {
+            **_DEFAULT_PARAMS,
+            "path": search_path,
+            "pattern": pattern,
+            "dirs_only": pattern.endswith('/'),
+            "preview": config.get("show_preview", True),
+            "exclude": list(config.get("default_excludes", ()))
+        }
+
+    # Search type choice values mapped to the prompt that builds their params
+    _SEARCH_HANDLERS = {
+        "name": _ask_name,
+        "content": _ask_content,
+        "folders": _ask_folders,
+        "file_type": _ask_file_type,
+        "custom": _ask_custom
+    }
+
+    def _add_result_row(self, table: Table, result: dict):
+        """Append a result (and its preview, if any) to the table"""
+        table.add_row(
+            result["path"],
+            result["size"],
+            result["modified"],
+            result["type"]
+        )
+
+        # Previews come as a preview_fn callable and are only read now that the row is shown;
+        # the result is kept so redrawing the row doesn't read the file again
+        preview_fn = result.pop("preview_fn", None)
+        if preview_fn is not None:
+            result["preview"] = preview_fn()
+        preview = result.get("preview")
+        if preview:
             table.add_row(
-                result["path"],
-                result["size"],
-                result["modified"],
-                result["type"]
+                Panel(preview, border_style="dim"),
+                "", "", "",
+                style="dim"
             )
 
-            if result.get("preview"):
-                table.add_row(
-                    Panel(result["preview"], border_style="dim"),
-                    "", "", "",
-                    style="dim"
-                )
+    def display_results(self, results: Iterable[dict],
+                        sort: Optional[Callable[[List[dict]], List[dict]]] = None):
+        """Display search results in a table that grows as results arrive.
+
+        When sort is given, the finished table is redrawn with the rows it
+        returns for the complete list of streamed rows.
+        """
+        table = _make_results_table()
+        rows = []
+        with Live(table, console=self.console, refresh_per_second=10) as live:
+            for result in results:
+                self._add_result_row(table, result)
+                rows.append(result)
+            if sort is not None and rows:
+                table = _make_results_table()
+                for result in sort(rows):
+                    self._add_result_row(table, result)
+                live.update(table)
 
-        self.console.print(table)
+        if not rows:
+            self.console.print("\n[yellow]No results found[/yellow]")